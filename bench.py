@@ -0,0 +1,323 @@
+"""
+텍스트 처리 & 패키징 핫패스 벤치마크
+===================================
+네트워크 없이 합성한 한국어/영어 자동 자막 말뭉치로 app.py의 핵심 함수
+(clean_text, parse_vtt_lines, remove_duplicate_lines/_find_overlap,
+build_filename, write_archive_shards)의 실행 시간과 최대 메모리를 측정합니다.
+
+사용 예:
+    python bench.py                      # quick 프로파일 실행 & 결과 표 출력
+    python bench.py --profile full       # 1KB~5MB, 10~5,000개 전체 범위
+    python bench.py --save-baseline      # 현재 결과를 기준선으로 저장
+    python bench.py --compare            # 기준선 대비 회귀 검사 (회귀 시 종료 코드 1)
+
+기준선은 측정한 장비에 따라 달라지므로, 같은 장비에서 저장/비교해야 합니다.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from app import (
+    _find_overlap,
+    build_filename,
+    clean_text,
+    parse_vtt_lines,
+    remove_duplicate_lines,
+    vtt_to_transcript,
+    write_archive_shards,
+)
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+# 프로파일별 말뭉치 크기 (바이트) 및 ZIP 파일 수
+PROFILES = {
+    "quick": {
+        "sizes": [1_024, 64 * 1_024, 1_024 * 1_024],
+        "counts": [10, 500],
+    },
+    "full": {
+        "sizes": [1_024, 64 * 1_024, 1_024 * 1_024, 5 * 1_024 * 1_024],
+        "counts": [10, 500, 5_000],
+    },
+}
+
+KO_WORDS = (
+    "하나님의 말씀을 오늘 우리가 함께 나누고자 합니다 예수님께서 제자들에게 "
+    "말씀하시기를 너희는 세상의 빛이요 소금이라 하셨습니다 여러분 은혜 가운데 "
+    "믿음으로 살아가는 성도가 되시기를 축원합니다 아멘"
+).split()
+EN_WORDS = (
+    "today we are going to look at the passage where Jesus tells his disciples "
+    "that they are the light of the world and the salt of the earth amen"
+).split()
+NOISE = ["[음악]", "[박수]", "[Music]", "&nbsp;", "&amp;", "<c>", "</c>", "~", "!"]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 1. CORPUS — 합성 자동 자막 생성
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def make_caption_lines(target_bytes: int, seed: int = 0) -> list[str]:
+    """
+    유튜브 자동 자막처럼 앞 줄의 끝부분이 다음 줄 앞에 반복되는(rolling) 라인을 만든다.
+
+    한국어:영어 비율은 약 4:1이며, 일부 줄에는 소음 표기/태그를 섞는다.
+    """
+    rng = random.Random(seed)
+    lines = []
+    size = 0
+    carry: list[str] = []
+    while size < target_bytes:
+        words = KO_WORDS if rng.random() < 0.8 else EN_WORDS
+        fresh = [rng.choice(words) for _ in range(rng.randint(3, 7))]
+        if rng.random() < 0.1:
+            fresh.insert(rng.randrange(len(fresh) + 1), rng.choice(NOISE))
+        line = " ".join(carry + fresh)
+        lines.append(line)
+        if rng.random() < 0.05:
+            lines.append(line)  # 완전히 동일한 줄 반복
+        size += len(line.encode("utf-8")) + 1
+        carry = fresh[-rng.randint(1, 3):]
+    return lines
+
+
+def make_raw_transcript(target_bytes: int, seed: int = 0) -> str:
+    """clean_text 입력용 — 스니펫을 이어붙인 원본 자막 텍스트."""
+    return " ".join(make_caption_lines(target_bytes, seed))
+
+
+def make_vtt(target_bytes: int, seed: int = 0) -> str:
+    """parse_vtt_lines 입력용 — 헤더, 큐 번호, 타임스탬프를 포함한 VTT 문서."""
+    out = ["WEBVTT", "Kind: captions", "Language: ko", ""]
+    for i, line in enumerate(make_caption_lines(target_bytes, seed), start=1):
+        start = i * 2.0
+        out.append(str(i))
+        out.append(f"{_vtt_time(start)} --> {_vtt_time(start + 2.0)} align:start position:0%")
+        out.append(line)
+        out.append("")
+    return "\n".join(out)
+
+
+def _vtt_time(seconds: float) -> str:
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f"{int(hours):02d}:{int(minutes):02d}:{secs:06.3f}"
+
+
+def make_titles(count: int, seed: int = 0) -> list[str]:
+    """build_filename 입력용 — 금지 문자와 긴 제목을 섞은 설교 제목."""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(count):
+        words = [rng.choice(KO_WORDS) for _ in range(rng.randint(2, 40))]
+        if rng.random() < 0.3:
+            words.insert(0, rng.choice(['"주일"', "2024/01/07", "요한복음 3:16", "<특별>", "Q&A?"]))
+        titles.append(" ".join(words))
+    return titles
+
+
+def _human_size(num_bytes: int) -> str:
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes // (1024 * 1024)}MB"
+    return f"{num_bytes // 1024}KB"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 2. MEASUREMENT — 시간 & 최대 메모리
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def measure(func: Callable[[], object], min_time: float = 0.2, max_repeat: int = 20) -> dict:
+    """
+    func의 최소 실행 시간(초)과 최대 메모리 할당량(바이트)을 측정한다.
+
+    왜: 최솟값은 다른 프로세스의 간섭이 가장 적은 실행이라 장비 내 재현성이 높다.
+    tracemalloc은 실행을 느리게 하므로 시간 측정과 분리해 한 번만 실행한다.
+    """
+    timings = []
+    total = 0.0
+    while len(timings) < max_repeat and (total < min_time or len(timings) < 3):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        timings.append(elapsed)
+        total += elapsed
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(timings), "peak_bytes": peak, "repeats": len(timings)}
+
+
+def run_benchmarks(profile: str, min_time: float) -> dict:
+    """프로파일에 정의된 모든 벤치마크를 실행하고 {이름: 결과} 를 반환한다."""
+    config = PROFILES[profile]
+    results = {}
+
+    def _record(name: str, func: Callable[[], object], input_bytes: int = 0) -> None:
+        result = measure(func, min_time=min_time)
+        if input_bytes:
+            result["mb_per_s"] = input_bytes / result["seconds"] / 1e6
+        results[name] = result
+        print(_format_row(name, result), file=sys.stderr)
+
+    for size in config["sizes"]:
+        label = _human_size(size)
+
+        raw = make_raw_transcript(size)
+        _record(f"clean_text[{label}]", lambda: clean_text(raw), len(raw.encode("utf-8")))
+
+        vtt = make_vtt(size)
+        _record(f"parse_vtt_lines[{label}]", lambda: parse_vtt_lines(vtt), len(vtt.encode("utf-8")))
+        with tempfile.NamedTemporaryFile("w", suffix=".vtt", encoding="utf-8", delete=False) as f:
+            f.write(vtt)
+        try:
+            _record(
+                f"vtt_to_transcript[{label}]",
+                lambda: vtt_to_transcript(f.name),
+                len(vtt.encode("utf-8")),
+            )
+        finally:
+            os.remove(f.name)
+
+        lines = make_caption_lines(size)
+        _record(
+            f"remove_duplicate_lines[{label}]",
+            lambda: remove_duplicate_lines(lines),
+            sum(len(line.encode("utf-8")) + 1 for line in lines),
+        )
+
+    # 긴 라인 쌍 — 겹침 탐색 자체의 비용 (일반 + 반복 문자 최악 입력)
+    long_line = " ".join(make_caption_lines(16 * 1024))
+    shifted = long_line[len(long_line) // 2:] + " 아멘"
+    _record("_find_overlap[16KB]", lambda: _find_overlap(long_line, shifted))
+    repetitive = "아" * 20_000
+    _record("_find_overlap[worst-20k]", lambda: _find_overlap(repetitive, repetitive[:-1] + "멘"))
+
+    titles = make_titles(5_000)
+    _record(
+        "build_filename[5000]",
+        lambda: [build_filename(i, "20240107", t) for i, t in enumerate(titles, start=1)],
+    )
+
+    for count in config["counts"]:
+        transcripts = [make_raw_transcript(4 * 1024, seed=i) for i in range(count)]
+        names = [build_filename(i, "20240107", f"설교 {i}") for i in range(1, count + 1)]
+        total_bytes = sum(len(t.encode("utf-8")) for t in transcripts)
+
+        source_dir = tempfile.mkdtemp(prefix="sermon_bench_")
+        try:
+            records = []
+            for i, (name, text) in enumerate(zip(names, transcripts), start=1):
+                with open(os.path.join(source_dir, name), "w", encoding="utf-8") as f:
+                    f.write(text)
+                records.append({
+                    "id": f"bench{i}", "index": i, "title": f"설교 {i}",
+                    "upload_date": "20240107", "filename": name,
+                })
+            dest_dir = os.path.join(source_dir, "zip")
+            _record(
+                f"write_archive_shards[{count}]",
+                lambda: write_archive_shards(source_dir, records, dest_dir, "bench"),
+                total_bytes,
+            )
+        finally:
+            shutil.rmtree(source_dir, ignore_errors=True)
+
+    return results
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 3. REPORT — 결과 표 & 기준선 비교
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _format_row(name: str, result: dict) -> str:
+    throughput = f"{result['mb_per_s']:8.1f} MB/s" if "mb_per_s" in result else " " * 13
+    return (
+        f"{name:<34} {result['seconds'] * 1000:10.3f} ms  {throughput}"
+        f"  peak {result['peak_bytes'] / 1024:10.1f} KB"
+    )
+
+
+# 이보다 작은 절대 차이는 측정 잡음으로 보고 회귀로 판단하지 않는다
+NOISE_FLOOR = {"seconds": 0.002, "peak_bytes": 64 * 1024}
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    기준선보다 tolerance 비율 이상 느려졌거나 메모리를 더 쓴 항목을 찾는다.
+
+    밀리초 단위로 끝나는 항목은 잡음이 크므로 NOISE_FLOOR 이하의 절대 차이는 무시한다.
+
+    Returns:
+        회귀 설명 문자열 목록 (비어 있으면 회귀 없음)
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for key, label in (("seconds", "시간"), ("peak_bytes", "메모리")):
+            allowed = max(base[key] * tolerance, NOISE_FLOOR[key])
+            if result[key] - base[key] > allowed:
+                regressions.append(
+                    f"{name}: {label} {result[key] / base[key]:.2f}배 "
+                    f"({base[key]:.6g} → {result[key]:.6g})"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="텍스트 처리 & 패키징 핫패스 벤치마크")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--min-time", type=float, default=0.2, help="항목별 최소 측정 시간(초)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="기준선 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준선으로 저장")
+    parser.add_argument("--compare", action="store_true", help="기준선과 비교해 회귀 시 종료 코드 1")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="회귀로 판단할 허용 비율 (기본 0.25 = 25%% 이상 악화)",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 stdout에 출력")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.profile, args.min_time)
+
+    if args.json:
+        print(json.dumps({"profile": args.profile, "results": results}, ensure_ascii=False, indent=2))
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"기준선 저장: {args.baseline}", file=sys.stderr)
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"기준선 파일이 없습니다: {args.baseline}", file=sys.stderr)
+            return 2
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("⚠️ 성능 회귀 감지:", file=sys.stderr)
+            for line in regressions:
+                print(f"  - {line}", file=sys.stderr)
+            return 1
+        print("✅ 기준선 대비 회귀 없음", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
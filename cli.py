@@ -0,0 +1,613 @@
+"""
+설교 스크립트 일괄 추출 CLI
+===========================
+Streamlit 없이 cron, 배치 서버 등에서 재생목록 자막을 추출합니다.
+영상 처리는 웹 화면의 작업과 같은 app.py의 파이프라인(iter_process_entries)을
+그대로 쓰고, 클리닝만 프로세스 풀(--processes)에서 여러 코어로 나눠 돌립니다.
+
+사용 예:
+    python cli.py "https://www.youtube.com/playlist?list=..." -o 설교.zip
+    python cli.py URL1 URL2 -o ./scripts --sync
+    python cli.py --ids-file ids.txt -o ./scripts
+    python cli.py --list-jobs
+    python cli.py --resume 3f2a9c1b7d4e
+    python cli.py URL -o ./scripts --index
+    python cli.py --search "믿음으로 구원" --limit 5
+    python cli.py URL -o ./scripts --keep-raw
+    python cli.py --reclean -o ./scripts --drop-fillers
+
+실행마다 작업 저널(APP_DATA_DIR/jobs/<작업 ID>)이 남으므로, 중간에 죽거나
+Ctrl+C로 멈춘 작업은 --resume으로 끝나지 않은 영상부터 이어서 처리합니다.
+웹 화면에서 시작한 작업도 -o를 지정하면 이어서 할 수 있습니다.
+
+--keep-raw(또는 SERMON_KEEP_RAW=1)로 받은 원본 자막을 APP_DATA_DIR/raw에 따로
+보관해 두면, 클리닝 규칙을 바꾼 뒤에 --reclean으로 자막을 다시 받지 않고 모든
+코어에서 결과만 다시 만들 수 있습니다. 원본과 규칙이 그대로인 영상은 건너뜁니다.
+
+ID 파일은 한 줄에 영상 ID(또는 영상 URL) 하나이며, 탭으로 구분해
+제목과 업로드 날짜(YYYYMMDD)를 덧붙일 수 있습니다. '#'으로 시작하는 줄은 무시합니다.
+
+종료 코드:
+    0   모든 영상 성공 (또는 새로 처리할 영상 없음)
+    1   일부 영상 실패 (또는 재생목록을 끝까지 열거하지 못함)
+    2   잘못된 사용법
+    3   영상을 찾지 못했거나 모두 실패
+    130 사용자 중단 (Ctrl+C)
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Optional
+
+from app import (
+    DEFAULT_COMPRESS_LEVEL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_REQUESTS_PER_SECOND,
+    EVENT_LOG_PATH,
+    KEEP_RAW_TRANSCRIPTS,
+    METRICS,
+    METRICS_HOST,
+    METRICS_PORT,
+    METRICS_TEXTFILE,
+    PROFILE_ENABLED,
+    PROXY_URLS,
+    SHARD_MAX_BYTES,
+    SHARD_MAX_FILES,
+    STRUCTURED_FORMATS,
+    TRANSCRIPT_ENDPOINT,
+    CircuitBreaker,
+    CleaningRules,
+    DirectorySink,
+    EventLog,
+    JobJournal,
+    PlaylistFeed,
+    ProxyPool,
+    RateLimiter,
+    RawStore,
+    RunProfiler,
+    RunReport,
+    SearchIndex,
+    SyncManifest,
+    TranscriptCache,
+    create_transcript_fetcher,
+    egress_count,
+    export_directory,
+    get_event_log,
+    index_width,
+    iter_journal_entries,
+    iter_process_entries,
+    playlist_key,
+    reclean_corpus,
+    repad_filename,
+    save_manifest,
+    set_event_log,
+    start_metrics_server,
+    write_archive_shards,
+)
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_PARTIAL_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_NOTHING_EXTRACTED = 3
+EXIT_INTERRUPTED = 130
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 1. INPUT — 명령행 인자 & 입력 소스
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 해석한다."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="유튜브 재생목록의 설교 자막을 일괄 추출합니다.",
+    )
+    parser.add_argument("urls", nargs="*", help="재생목록 또는 영상 URL (여러 개 가능)")
+    parser.add_argument("--ids-file", help="영상 ID 목록 파일 (한 줄에 하나)")
+    parser.add_argument(
+        "-o", "--output",
+        help="출력 경로 — .zip으로 끝나면 ZIP, 아니면 디렉토리 (--resume이면 생략 가능)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"동시 자막 요청 스레드 수 (기본 {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--rps", type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+        help=f"초당 요청 수 한도 — 프록시를 쓰면 프록시 하나당 (기본 {DEFAULT_REQUESTS_PER_SECOND})",
+    )
+    parser.add_argument(
+        "--processes", type=int, default=os.cpu_count() or 1,
+        help="클리닝 프로세스 수 (0이면 메인 프로세스에서 처리)",
+    )
+    parser.add_argument(
+        "--compress-level", type=int, default=DEFAULT_COMPRESS_LEVEL,
+        choices=range(0, 10), metavar="0-9", help="ZIP 압축 레벨",
+    )
+    parser.add_argument(
+        "--transcript-endpoint", default=TRANSCRIPT_ENDPOINT,
+        help="유튜브 대신 사용할 자막·재생목록 서비스 주소 (예: stub_server.py 로컬 대역 서버)",
+    )
+    parser.add_argument(
+        "--proxies", type=lambda value: [url.strip() for url in value.split(",") if url.strip()],
+        default=list(PROXY_URLS),
+        help="자막 요청을 나눠 보낼 HTTP(S) 프록시 목록 (쉼표 구분, 기본 SERMON_PROXIES)",
+    )
+    parser.add_argument(
+        "--shard-files", type=int, default=SHARD_MAX_FILES,
+        help=f"ZIP 하나에 넣을 최대 영상 수 — 넘으면 -part001.zip...으로 나누고 매니페스트 작성 (기본 {SHARD_MAX_FILES})",
+    )
+    parser.add_argument(
+        "--shard-mb", type=float, default=SHARD_MAX_BYTES / 1024 / 1024,
+        help="ZIP 하나에 넣을 최대 원본 크기(MB)",
+    )
+    parser.add_argument("--sync", action="store_true", help="재생목록별로 새로 추가된 영상만 처리")
+    parser.add_argument("--refresh-cache", action="store_true", help="자막 캐시를 무시하고 새로 받기")
+    parser.add_argument(
+        "--refresh-playlist", action="store_true",
+        help="재생목록 캐시를 지우고 목록을 다시 분석 (기본: SERMON_PLAYLIST_TTL_MIN분 동안 재사용)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="자막 캐시를 사용하지 않음")
+    parser.add_argument("--keep-bracketed", action="store_true", help="[음악] 등 대괄호 주석 유지")
+    parser.add_argument("--drop-fillers", action="store_true", help="간투사(어, 음 등) 제거")
+    parser.add_argument(
+        "--resume", metavar="JOB_ID",
+        help="중단된 작업을 이어서 처리 (클리닝 규칙·압축·동기화 설정은 원래 작업을 따름)",
+    )
+    parser.add_argument("--list-jobs", action="store_true", help="이어서 할 수 있는 작업 목록 출력")
+    parser.add_argument(
+        "--formats", type=lambda value: [fmt.strip().lower() for fmt in value.split(",") if fmt.strip()],
+        default=[],
+        help=f"타임스탬프 포함 추가 출력 (쉼표 구분: {','.join(STRUCTURED_FORMATS)})",
+    )
+    parser.add_argument("--index", action="store_true", help="추출한 설교를 전문 검색 색인에 추가")
+    parser.add_argument("--search", metavar="QUERY", help="검색 색인에서 설교를 찾아 JSON으로 출력")
+    parser.add_argument("--limit", type=int, default=20, help="--search 결과 최대 개수 (기본 20)")
+    parser.add_argument(
+        "--event-log", default=EVENT_LOG_PATH, metavar="PATH",
+        help="영상별 구조화 이벤트(JSON Lines)를 남길 파일 ('-'이면 stderr, 기본 SERMON_EVENT_LOG)",
+    )
+    parser.add_argument(
+        "--metrics-file", default=METRICS_TEXTFILE, metavar="PATH",
+        help="끝날 때 Prometheus 지표를 쓸 파일 (node_exporter textfile collector용)",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=METRICS_PORT,
+        help="실행 중 /metrics 엔드포인트를 띄울 포트 (0이면 끔, 기본 SERMON_METRICS_PORT)",
+    )
+    parser.add_argument(
+        "--metrics-host", default=METRICS_HOST,
+        help="/metrics를 바인딩할 주소 — 다른 호스트에서 수집하려면 0.0.0.0 (기본 SERMON_METRICS_HOST, 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", default=PROFILE_ENABLED,
+        help="실행 전체를 cProfile/tracemalloc으로 측정해 -o 옆에 <이름>.pstats/.profile.txt/.alloc.txt 저장 (기본 SERMON_PROFILE)",
+    )
+    parser.add_argument(
+        "--keep-raw", action="store_true", default=KEEP_RAW_TRANSCRIPTS,
+        help="받은 원본 자막을 --reclean용으로 기한 없이 보관 (기본 SERMON_KEEP_RAW)",
+    )
+    parser.add_argument(
+        "--reclean", action="store_true",
+        help="--keep-raw로 보관된 원본 자막 전체를 다시 클리닝해 -o 디렉토리에 저장 (자막을 다시 받지 않음)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.list_jobs or args.search:
+        return args
+    unknown = set(args.formats) - set(STRUCTURED_FORMATS)
+    if unknown:
+        parser.error(f"지원하지 않는 출력 형식: {', '.join(sorted(unknown))}")
+    if args.reclean:
+        if args.urls or args.ids_file or args.resume:
+            parser.error("--reclean은 URL/--ids-file/--resume과 함께 쓸 수 없습니다.")
+        if not args.output or args.output.lower().endswith(".zip"):
+            parser.error("--reclean에는 출력 디렉토리(-o)가 필요합니다.")
+        return args
+    if args.resume:
+        if args.urls or args.ids_file:
+            parser.error("--resume은 URL/--ids-file과 함께 쓸 수 없습니다.")
+        return args
+    if not args.urls and not args.ids_file:
+        parser.error("URL 또는 --ids-file 중 하나 이상이 필요합니다.")
+    if not args.output:
+        parser.error("-o/--output이 필요합니다.")
+    return args
+
+
+def read_ids_file(path: str) -> list[dict]:
+    """
+    ID 목록 파일을 get_playlist_entries와 같은 형식의 entry 목록으로 변환한다.
+
+    왜: 제목/날짜를 알기 위해 영상마다 메타데이터를 따로 요청하면
+    요청 한도를 낭비하므로, 필요하면 파일에 탭으로 함께 적도록 한다.
+    """
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            fields = line.split("\t")
+            video_id = fields[0].strip()
+            if "/" in video_id:
+                # 영상 URL이 들어온 경우 ID만 추출
+                video_id = playlist_key(video_id).removeprefix("video-")
+
+            entries.append({
+                "index": len(entries) + 1,
+                "id": video_id,
+                "title": fields[1].strip() if len(fields) > 1 else video_id,
+                "upload_date": fields[2].strip() if len(fields) > 2 else "00000000",
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+            })
+    return entries
+
+
+def collect_sources(args: argparse.Namespace) -> list[dict]:
+    """
+    입력 URL/ID 파일마다 {label, url[, entries]} 소스를 만든다.
+
+    재생목록은 처리하면서 열거하므로(iter_journal_entries) 여기서는 목록을 받지 않고,
+    로컬 파일인 ID 목록만 바로 읽어 entries에 담는다.
+    소스가 여러 개이면 순번이 겹치지 않도록 label 하위 폴더에 저장한다.
+    """
+    sources = [{"label": playlist_key(url), "url": url} for url in args.urls]
+    if args.ids_file:
+        sources.append({
+            "label": os.path.splitext(os.path.basename(args.ids_file))[0],
+            "url": None,
+            "entries": read_ids_file(args.ids_file),
+        })
+    return sources
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 2. PIPELINE — 스레드 풀(네트워크) + 프로세스 풀(클리닝)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def create_journal(args: argparse.Namespace) -> tuple[JobJournal, CleaningRules]:
+    """
+    입력 소스로 새 작업 저널을 만든다.
+
+    재생목록 영상은 실행 중에 열거되는 대로 저널에 추가되므로(listed=False),
+    처음에는 ID 파일의 영상만 들어 있다.
+    """
+    sources = collect_sources(args)
+    rules = CleaningRules(
+        keep_bracketed=args.keep_bracketed,
+        drop_fillers=args.drop_fillers,
+    )
+    multi_source = len(sources) > 1
+    journal = JobJournal.create(
+        uuid.uuid4().hex[:12],
+        sources=[{"label": source["label"], "url": source["url"]} for source in sources],
+        entries=[
+            {**entry, "source": source["label"]} if multi_source else entry
+            for source in sources
+            for entry in source.get("entries", ())
+        ],
+        options={
+            "concurrency": args.concurrency,
+            "requests_per_second": args.rps,
+            "refresh_cache": args.refresh_cache,
+            "refresh_playlist": args.refresh_playlist,
+            "index_search": args.index,
+            "formats": args.formats,
+            "sync_mode": args.sync,
+            "compress_level": args.compress_level,
+            "cleaning_rules": rules,
+        },
+        # 결과는 작업 디렉토리에 쌓았다가 끝날 때 -o로 내보낸다 (ZIP 샤드 또는 디렉토리)
+        output=os.path.abspath(args.output),
+        listed=not any(source["url"] for source in sources),
+    )
+    return journal, rules
+
+
+def resume_journal(args: argparse.Namespace) -> tuple[JobJournal, CleaningRules]:
+    """
+    중단된 작업 저널을 연다 (열거 도중 멈춘 작업은 실행하면서 열거도 이어서 한다).
+
+    출력 모양을 결정하는 설정(동기화·압축·출력 형식·클리닝 규칙)은 원래 작업을 따르고,
+    속도/캐시 설정만 이번 인자를 쓴다.
+    """
+    journal = JobJournal.load(args.resume)
+    options = journal.options
+    args.output = args.output or journal.meta["output"]
+    if not args.output:
+        raise ValueError("웹 화면에서 시작한 작업은 -o/--output을 지정해야 합니다.")
+    args.sync = options["sync_mode"]
+    args.compress_level = options["compress_level"]
+    args.formats = options.get("formats", [])
+    return journal, options["cleaning_rules"]
+
+
+def write_output(journal: JobJournal, args: argparse.Namespace) -> list[dict]:
+    """
+    작업 전체의 결과를 -o로 내보내고 샤드 목록을 반환한다 (디렉토리면 빈 목록).
+
+    이어서 한 작업이면 이전 실행의 결과까지 모두 포함한다.
+    """
+    if not args.output.lower().endswith(".zip"):
+        export_directory(journal.scripts_dir, journal.completed(), args.output)
+        return []
+    # 한도를 넘으면 -o 옆에 <이름>-part001.zip...과 매니페스트(JSON/CSV)를 만든다
+    output_dir = os.path.dirname(os.path.abspath(args.output))
+    archive = write_archive_shards(
+        journal.scripts_dir,
+        journal.completed(),
+        output_dir,
+        os.path.splitext(os.path.basename(args.output))[0],
+        max_files=max(1, args.shard_files),
+        max_bytes=int(args.shard_mb * 1024 * 1024),
+        compresslevel=args.compress_level,
+    )
+    if len(archive["shards"]) > 1:
+        save_manifest(archive, output_dir)
+    return [
+        {key: shard[key] for key in ("name", "videos", "bytes", "sha256")}
+        for shard in archive["shards"]
+    ]
+
+
+def run(args: argparse.Namespace, stop_event: threading.Event) -> dict:
+    """
+    모든 소스를 처리하고 실행 요약(dict)을 반환한다.
+
+    영상 처리는 웹 화면의 작업과 같은 iter_process_entries(공유 속도 제한기를 쓰는
+    스레드 풀, 429 재시도 대기열, 저장, 지표)로 하고, 클리닝만 GIL의 영향을 받지
+    않도록 프로세스 풀(--processes)에 넘긴다. 첫 Ctrl+C는 대기 중인 영상을 취소하고
+    진행 중인 영상만 마무리한 뒤 지금까지의 결과를 내보낸다.
+
+    재생목록은 웹 화면처럼 PlaylistFeed로 열거되는 대로 처리하므로 처음에는 전체
+    개수를 모른다 — 요약의 found/total은 이번 실행에서 열거·처리한 수이고,
+    listed=False이면 목록을 끝까지 받지 못한 것이다 (--resume으로 이어서 열거).
+    """
+    started = time.monotonic()
+    JobJournal.prune()
+    journal, rules = resume_journal(args) if args.resume else create_journal(args)
+    logger.info(f"작업 ID: {journal.id} (중단되면 --resume {journal.id} 로 이어서 처리)")
+    sources = journal.meta["sources"]
+    default_label = sources[0]["label"] if sources else ""
+    manifests = {
+        source["label"]: SyncManifest(source["url"])
+        for source in sources
+        if args.sync and source["url"]
+    }
+    # 저널에 남은 영상(새 작업이면 ID 파일의 영상) 먼저, 이어서 새로 열거되는 영상
+    remaining = journal.remaining_entries()
+    known_count = len(journal.entries)
+    found: dict[str, int] = {}  # 소스 label → 이번 실행에서 열거한 영상 수 (동기화로 건너뛴 영상 포함)
+
+    # 실행 전체가 하나의 연결 풀(keep-alive)을 공유하도록 가져오기 계층을 준비
+    # (프록시가 있으면 프록시마다 연결 풀과 --rps 토큰 버킷을 따로 둔다)
+    fetcher = create_transcript_fetcher(
+        pool_size=max(1, args.concurrency),
+        endpoint=args.transcript_endpoint,
+        proxies=args.proxies,
+        requests_per_second=args.rps,
+    )
+    # 자막 API가 실패한 영상은 yt-dlp VTT 자막으로 한 번 더 시도 (받은 파일은 변환 후 삭제)
+    subtitle_tmp_dir = tempfile.mkdtemp(prefix="sermon_vtt_")
+    # Ctrl+C는 메인 프로세스에서만 처리한다 (작업 프로세스가 받으면 풀이 깨진다)
+    process_pool = (
+        ProcessPoolExecutor(
+            max_workers=args.processes,
+            initializer=signal.signal,
+            initargs=(signal.SIGINT, signal.SIG_IGN),
+        )
+        if args.processes > 0 else None
+    )
+
+    def _interrupt(signum, frame) -> None:
+        logger.warning("중단 요청 — 지금까지 처리된 결과만 저장합니다. (다시 누르면 바로 종료)")
+        stop_event.set()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    previous_handler = (
+        signal.signal(signal.SIGINT, _interrupt)
+        if threading.current_thread() is threading.main_thread() else None
+    )
+
+    report = RunReport()
+    succeeded = []
+    failures = []
+    feed = PlaylistFeed(
+        iter_journal_entries(
+            journal,
+            manifests,
+            endpoint=args.transcript_endpoint,
+            refresh=args.refresh_playlist,
+            on_found=found.__setitem__,
+        ),
+        stop_event=stop_event,
+    )
+    try:
+        for entry, result in iter_process_entries(
+            feed,
+            journal.scripts_dir,
+            subtitle_tmp_dir,
+            concurrency=args.concurrency,
+            limiter=RateLimiter(args.rps * egress_count(fetcher)),
+            stop_event=stop_event,
+            cache=None if args.no_cache else TranscriptCache(),
+            refresh=args.refresh_cache,
+            rules=rules,
+            sink=DirectorySink(journal.scripts_dir),
+            breaker=CircuitBreaker(),
+            fetcher=fetcher,
+            index=SearchIndex() if args.index else None,
+            formats=tuple(args.formats),
+            raw_store=RawStore() if args.keep_raw else None,
+            clean_executor=process_pool,
+            source_folders=len(sources) > 1,
+        ):
+            report.add(result)
+            journal.record(entry, result)
+            if not result["success"]:
+                failures.append({
+                    "id": entry["id"],
+                    "title": entry["title"],
+                    "error": result["error"],
+                    "outcome": result["outcome"],
+                })
+                continue
+            succeeded.append((entry, result["filename"]))
+            manifest = manifests.get(entry.get("source", default_label))
+            if manifest is not None:
+                manifest.mark_done(entry, result["filename"])
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
+        if process_pool is not None:
+            process_pool.shutdown(cancel_futures=True)
+        fetcher.close()
+        shutil.rmtree(subtitle_tmp_dir, ignore_errors=True)
+        for manifest in manifests.values():
+            manifest.save()
+        journal.set_state("stopped" if stop_event.is_set() else "done")
+
+    shards = write_output(journal, args)
+    report.finish()
+    run_report = report.summary()
+    run_report.pop("videos_detail")  # 영상별 정보는 files/failures에 이미 있음
+    proxy_pool = getattr(fetcher, "inner", fetcher)
+    # 출력(ZIP·디렉토리)의 파일명은 가장 큰 순번의 자릿수로 다시 패딩되어 있다
+    width = index_width(max((entry.get("index", 0) for entry in journal.entries), default=0))
+    queued = remaining + journal.entries[known_count:]
+
+    def _count(entries: list[dict], label: str) -> int:
+        return sum(1 for entry in entries if entry.get("source", default_label) == label)
+
+    return {
+        "job_id": journal.id,
+        "output": os.path.abspath(args.output),
+        "sources": [
+            {
+                "label": source["label"],
+                "url": source["url"],
+                # 다시 열거하지 않고 이어서 한 작업은 저널에 있는 영상 수
+                "found": max(found.get(source["label"], 0), _count(journal.entries, source["label"])),
+                "pending": _count(queued, source["label"]),
+            }
+            for source in sources
+        ],
+        "listed": journal.listed,
+        "listing_error": str(feed.error) if feed.error is not None else None,
+        "total": len(queued),
+        "succeeded": len(succeeded),
+        "failed": len(failures),
+        "interrupted": stop_event.is_set(),
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+        "files": [
+            {"id": entry["id"], "title": entry["title"], "file": repad_filename(filename, width)}
+            for entry, filename in succeeded
+        ],
+        "failures": failures,
+        "shards": shards,
+        "proxies": proxy_pool.stats() if isinstance(proxy_pool, ProxyPool) else [],
+        "report": run_report,
+    }
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 3. MAIN — 진입점 & 종료 코드
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def exit_code_for(summary: dict) -> int:
+    """실행 요약을 종료 코드로 변환한다."""
+    if summary["interrupted"]:
+        return EXIT_INTERRUPTED
+    if summary["total"] == 0:
+        # 새 영상이 없는 증분 동기화는 정상, 영상을 아예 못 찾은 경우는 실패
+        found = sum(source["found"] for source in summary["sources"])
+        return EXIT_OK if found and not summary["listing_error"] else EXIT_NOTHING_EXTRACTED
+    if summary["succeeded"] == 0:
+        return EXIT_NOTHING_EXTRACTED
+    if summary["failed"] or summary["listing_error"]:
+        return EXIT_PARTIAL_FAILURE
+    return EXIT_OK
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    CLI 진입점. 요약 JSON 한 줄을 stdout에, 로그는 stderr에 출력한다.
+    """
+    args = parse_args(argv)
+    if args.list_jobs:
+        print(json.dumps(JobJournal.list_jobs(), ensure_ascii=False))
+        return EXIT_OK
+    if args.search:
+        print(json.dumps(SearchIndex().search(args.search, args.limit), ensure_ascii=False))
+        return EXIT_OK
+    if args.reclean:
+        rules = CleaningRules(
+            keep_bracketed=args.keep_bracketed,
+            drop_fillers=args.drop_fillers,
+        )
+        summary = reclean_corpus(
+            args.output, rules, tuple(args.formats), processes=args.processes or 1,
+        )
+        print(json.dumps(summary, ensure_ascii=False))
+        return EXIT_PARTIAL_FAILURE if summary["errors"] else EXIT_OK
+    stop_event = threading.Event()
+    if args.event_log:
+        set_event_log(EventLog(args.event_log))
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port, args.metrics_host)
+
+    profiler = RunProfiler() if args.profile else None
+    try:
+        with profiler or nullcontext():
+            summary = run(args, stop_event)
+    except (FileNotFoundError, ValueError) as e:
+        # --resume에 없는 작업 ID를 주었거나 출력 경로가 없는 경우
+        logger.error(f"작업을 이어서 할 수 없습니다: {e}")
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        # 재생목록 분석 등 파이프라인 밖에서 중단된 경우
+        stop_event.set()
+        return EXIT_INTERRUPTED
+    finally:
+        if args.metrics_file:
+            METRICS.write_textfile(args.metrics_file)
+
+    if profiler is not None:
+        # 결과 ZIP/디렉토리 옆에 같은 이름으로 남긴다 (out.zip → out.pstats ...)
+        output = summary["output"].rstrip(os.sep)
+        files = profiler.write(
+            os.path.dirname(output), os.path.splitext(os.path.basename(output))[0],
+        )
+        summary["profile"] = [item["path"] for item in files]
+
+    get_event_log().emit(
+        "run_end",
+        job_id=summary["job_id"],
+        state="stopped" if summary["interrupted"] else "done",
+        videos=summary["total"],
+        succeeded=summary["succeeded"],
+        rate_limited=summary["report"]["rate_limited"],
+        elapsed_seconds=summary["elapsed_seconds"],
+    )
+    get_event_log().close()
+    print(json.dumps(summary, ensure_ascii=False))
+    return exit_code_for(summary)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+자막 서비스 로컬 대역(stand-in) 서버
+=====================================
+유튜브를 호출하지 않고 app.py/cli.py 전체 파이프라인의 동시성, 재시도,
+처리량을 측정하기 위한 로컬 HTTP 서버입니다. 녹화해 둔 픽스처
+(SERMON_FIXTURES_MODE=record로 저장한 재생목록/자막)나 합성 데이터를 돌려주며,
+지연 시간, 429 응답, 자막 없음 비율을 원하는 대로 주입할 수 있습니다.
+
+사용 예:
+    # 1) 실제 응답 녹화 (한 번만)
+    SERMON_FIXTURES_MODE=record python cli.py "https://www.youtube.com/playlist?list=..." -o out.zip
+
+    # 2) 녹화본을 지연 200ms, 429 5%로 서비스
+    python stub_server.py --fixtures ~/.cache/sermon-script-extractor/fixtures \\
+        --latency-ms 200 --rate-429 0.05
+
+    # 3) 픽스처 없이 합성 재생목록 (URL의 list=synthetic-<개수>)
+    python stub_server.py --synthetic --missing-rate 0.1
+
+    # 4) 앱/CLI를 대역 서버에 연결
+    SERMON_TRANSCRIPT_ENDPOINT=http://127.0.0.1:8765 streamlit run app.py
+    python cli.py "https://www.youtube.com/playlist?list=synthetic-500" -o out.zip \\
+        --transcript-endpoint http://127.0.0.1:8765 --rps 50 --concurrency 16 --no-cache
+
+    # 5) 출구(IP)별 한도가 초당 5회인 대역 프록시 4개 (8766~8769) — 프록시 풀 처리량 측정
+    python stub_server.py --synthetic --egress-rps 5 --proxies 4
+    python cli.py "https://www.youtube.com/playlist?list=synthetic-500" -o out.zip \\
+        --transcript-endpoint http://127.0.0.1:8765 --rps 5 --concurrency 16 --no-cache \\
+        --proxies http://127.0.0.1:8766,http://127.0.0.1:8767,http://127.0.0.1:8768,http://127.0.0.1:8769
+
+엔드포인트 (형식은 app.HttpTranscriptFetcher와 같음):
+    GET /playlists/<재생목록 키>   영상 목록 JSON (없으면 404)
+    GET /transcripts/<영상 ID>     {language, snippets} JSON (자막 없음은 404, 차단은 429)
+    GET /stats                     지금까지의 요청/응답 집계
+
+--proxies N이면 포트 +1 ~ +N에 같은 데이터를 돌려주는 대역 프록시를 더 띄운다.
+HTTP 프록시로 보낸 요청(GET http://호스트/경로)을 그대로 받아 응답하며, 각자
+--egress-rps 한도를 따로 두므로 서로 다른 출구 IP처럼 동작한다.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit
+
+from bench import make_caption_lines, make_titles
+
+logger = logging.getLogger(__name__)
+
+SYNTHETIC_TRANSCRIPT_BYTES = 40 * 1024  # 설교 한 편(약 40분) 분량의 자동 자막
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 1. DATA — 픽스처 & 합성 데이터
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class StubData:
+    """
+    픽스처 디렉토리(app.FixtureStore 형식)와 합성 데이터에서 응답 본문을 만든다.
+
+    Args:
+        fixtures_dir: playlists/, transcripts/ 하위 폴더가 있는 디렉토리 (없으면 None)
+        synthetic: True이면 픽스처에 없는 재생목록/영상을 합성해서 돌려준다
+        missing_rate: 자막 없음(404)으로 처리할 영상 비율 (영상 ID로 결정 — 매번 같은 결과)
+    """
+
+    _SYNTHETIC_PLAYLIST = re.compile(r"synthetic-(\d+)$")
+
+    def __init__(self, fixtures_dir: Optional[str], synthetic: bool, missing_rate: float):
+        self.fixtures_dir = fixtures_dir
+        self.synthetic = synthetic
+        self.missing_rate = missing_rate
+
+    def _load(self, kind: str, name: str) -> Optional[dict]:
+        if not self.fixtures_dir:
+            return None
+        path = os.path.join(self.fixtures_dir, kind, f"{name}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def playlist(self, key: str) -> Optional[list[dict]]:
+        recorded = self._load("playlists", key)
+        if recorded is not None:
+            return recorded["entries"]
+        match = self._SYNTHETIC_PLAYLIST.search(key)
+        if not (self.synthetic and match):
+            return None
+
+        count = int(match.group(1))
+        titles = make_titles(count, seed=count)
+        return [
+            {
+                "index": i,
+                "id": f"syn{count}x{i:05d}",
+                "title": titles[i - 1][:80],
+                "upload_date": f"2024{(i % 12) + 1:02d}{(i % 28) + 1:02d}",
+                "url": f"https://www.youtube.com/watch?v=syn{count}x{i:05d}",
+            }
+            for i in range(1, count + 1)
+        ]
+
+    def transcript(self, video_id: str) -> Optional[dict]:
+        if _fraction(video_id) < self.missing_rate:
+            return None
+        recorded = self._load("transcripts", video_id)
+        if recorded is not None:
+            return None if recorded.get("missing") else recorded
+        if not self.synthetic:
+            return None
+
+        seed = int(hashlib.sha1(video_id.encode("utf-8")).hexdigest()[:8], 16)
+        lines = make_caption_lines(SYNTHETIC_TRANSCRIPT_BYTES, seed=seed)
+        return {
+            "language": "ko",
+            "snippets": [
+                {"text": line, "start": i * 2.0, "duration": 2.0}
+                for i, line in enumerate(lines)
+            ],
+        }
+
+
+def _fraction(video_id: str) -> float:
+    """영상 ID를 [0, 1) 구간의 고정된 값으로 바꾼다 (비율 주입을 실행마다 같게 하기 위함)."""
+    return int(hashlib.sha1(video_id.encode("utf-8")).hexdigest()[:8], 16) / 0x100000000
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 2. SERVER — HTTP 핸들러 & 장애 주입
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class StubServer(ThreadingHTTPServer):
+    """요청마다 스레드 하나로 응답하는 대역 서버 (keep-alive 지원)."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        data: StubData,
+        latency_ms: float = 0.0,
+        jitter: float = 0.5,
+        rate_429: float = 0.0,
+        seed: Optional[int] = None,
+        egress_rps: float = 0.0,
+    ):
+        super().__init__(address, StubHandler)
+        self.data = data
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.rng = random.Random(seed)
+        # 출구(IP) 한도 — 초당 egress_rps를 넘는 자막 요청은 429 (0이면 한도 없음)
+        self.egress_rps = egress_rps
+        self._tokens = 2.0
+        self._last = time.monotonic()
+        self.stats = {"requests": 0, "ok": 0, "not_found": 0, "rate_limited": 0}
+        self.lock = threading.Lock()
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.stats[key] += 1
+
+    def delay(self) -> float:
+        """주입할 지연 시간(초) — latency_ms를 중심으로 ±jitter 비율만큼 흔든다."""
+        if self.latency_ms <= 0:
+            return 0.0
+        with self.lock:
+            factor = 1 + self.rng.uniform(-self.jitter, self.jitter)
+        return max(0.0, self.latency_ms * factor / 1000)
+
+    def should_block(self) -> bool:
+        with self.lock:
+            if self.egress_rps > 0:
+                # 짧은 몰림(2회)은 허용하는 토큰 버킷 — 유튜브의 IP별 한도 흉내
+                now = time.monotonic()
+                self._tokens = min(2.0, self._tokens + (now - self._last) * self.egress_rps)
+                self._last = now
+                if self._tokens < 1.0:
+                    return True
+                self._tokens -= 1.0
+            return self.rng.random() < self.rate_429
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def do_GET(self) -> None:
+        # 프록시로 들어온 요청은 절대 주소(GET http://호스트/경로)이므로 경로만 쓴다
+        path = urlsplit(self.path).path.rstrip("/")
+        if path == "/stats":
+            with self.server.lock:
+                self._send_json(200, dict(self.server.stats))
+            return
+
+        self.server.count("requests")
+        time.sleep(self.server.delay())
+
+        kind, _, name = path.lstrip("/").partition("/")
+        if kind not in ("playlists", "transcripts") or not name:
+            self.server.count("not_found")
+            self._send_json(404, {"error": "not found"})
+            return
+
+        # 유튜브처럼 자막 요청에만 429를 섞는다
+        if kind == "transcripts" and self.server.should_block():
+            self.server.count("rate_limited")
+            self._send_json(429, {"error": "Too Many Requests"}, {"Retry-After": "1"})
+            return
+
+        body = self.server.data.playlist(name) if kind == "playlists" else self.server.data.transcript(name)
+        if body is None:
+            self.server.count("not_found")
+            self._send_json(404, {"error": "not found"})
+            return
+        self.server.count("ok")
+        self._send_json(200, body)
+
+    def _send_json(self, status: int, body, headers: Optional[dict] = None) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format % args)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 3. MAIN — 진입점
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="자막 서비스 로컬 대역 서버 (오프라인 부하 테스트용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", help="녹화된 픽스처 디렉토리 (SERMON_FIXTURES_DIR 형식)")
+    parser.add_argument("--synthetic", action="store_true", help="픽스처에 없는 재생목록/자막을 합성")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 평균 (밀리초)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="지연 흔들림 비율 (0.5 = ±50%%)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="자막 요청 중 429로 응답할 비율")
+    parser.add_argument("--missing-rate", type=float, default=0.0, help="자막 없음(404)으로 처리할 영상 비율")
+    parser.add_argument("--seed", type=int, help="429 주입 난수 시드 (재현용)")
+    parser.add_argument(
+        "--egress-rps", type=float, default=0.0,
+        help="서버(출구) 하나당 초당 자막 요청 한도 — 넘으면 429 (0이면 한도 없음)",
+    )
+    parser.add_argument(
+        "--proxies", type=int, default=0,
+        help="포트 +1부터 띄울 대역 프록시(출구) 수 — 각자 --egress-rps 한도를 따로 가진다",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.fixtures and not args.synthetic:
+        parser.error("--fixtures 또는 --synthetic 중 하나 이상이 필요합니다.")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        stream=sys.stderr,
+    )
+    data = StubData(args.fixtures, args.synthetic, args.missing_rate)
+    servers = [
+        StubServer(
+            (args.host, args.port + offset if args.port else 0),
+            data,
+            latency_ms=args.latency_ms,
+            jitter=args.jitter,
+            rate_429=args.rate_429,
+            seed=None if args.seed is None else args.seed + offset,
+            egress_rps=args.egress_rps,
+        )
+        for offset in range(args.proxies + 1)
+    ]
+    server, proxies = servers[0], servers[1:]
+    logger.info(f"대역 서버 시작: http://{args.host}:{server.server_port}")
+    for proxy in proxies:
+        threading.Thread(target=proxy.serve_forever, daemon=True).start()
+    if proxies:
+        proxy_urls = ",".join(f"http://{args.host}:{proxy.server_port}" for proxy in proxies)
+        logger.info(f"대역 프록시 {len(proxies)}개: --proxies {proxy_urls}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for stub in servers:
+            stub.server_close()
+        logger.info(f"대역 서버 종료 — {json.dumps(server.stats)}")
+        for proxy in proxies:
+            logger.info(f"대역 프록시 :{proxy.server_port} — {json.dumps(proxy.stats)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
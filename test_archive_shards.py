@@ -0,0 +1,93 @@
+"""
+결과 샤드 ZIP(plan_archive_shards / write_archive_shards)과 매니페스트 체크섬 테스트.
+
+실행: python -m pytest -q test_archive_shards.py
+"""
+
+import csv
+import hashlib
+import io
+import json
+import pathlib
+import zipfile
+
+import app
+
+
+def _write_results(source_dir, count: int, size: int = 100, structured: tuple = ()) -> list[dict]:
+    """build_filename 기본 3자리 이름으로 결과 파일을 만들고 레코드를 반환한다."""
+    records = []
+    for index in range(1, count + 1):
+        filename = app.build_filename(index, "20240101", f"설교 {index}")
+        (source_dir / filename).write_text(str(index) * size, encoding="utf-8")
+        for fmt in structured:
+            (source_dir / filename.replace(".txt", f".{fmt}")).write_text("{}", encoding="utf-8")
+        records.append({"id": f"v{index}", "title": f"설교 {index}", "upload_date": "20240101",
+                        "index": index, "filename": filename})
+    return records
+
+
+def test_plan_splits_by_file_count_and_keeps_structured_outputs(tmp_path):
+    records = _write_results(tmp_path, 5, structured=("srt",))
+
+    plan = app.plan_archive_shards(str(tmp_path), records, max_files=2)
+    assert [[video["index"] for video in shard] for shard in plan] == [[1, 2], [3, 4], [5]]
+    assert [arcname for _, arcname in plan[0][0]["files"]] == [
+        "001 - 20240101 - 설교 1.txt", "001 - 20240101 - 설교 1.srt",
+    ]
+
+
+def test_plan_splits_by_bytes_but_never_drops_an_oversized_video(tmp_path):
+    records = _write_results(tmp_path, 3, size=100)
+
+    plan = app.plan_archive_shards(str(tmp_path), records, max_bytes=150)
+    assert [len(shard) for shard in plan] == [1, 1, 1]
+    assert app.plan_archive_shards(str(tmp_path), records, max_bytes=10)[0][0]["bytes"] == 100
+
+
+def test_plan_repads_names_past_999(tmp_path):
+    records = []
+    for index in (7, 1000):
+        filename = app.build_filename(index, "20240101", f"설교 {index}")
+        (tmp_path / filename).write_text("말씀", encoding="utf-8")
+        records.append({"id": f"v{index}", "title": f"설교 {index}", "upload_date": "20240101",
+                        "index": index, "filename": filename})
+
+    arcnames = [video["arcname"] for video in app.plan_archive_shards(str(tmp_path), records)[0]]
+    assert arcnames == ["0007 - 20240101 - 설교 7.txt", "1000 - 20240101 - 설교 1000.txt"]
+
+
+def test_write_shards_records_matching_checksums(tmp_path):
+    source_dir, dest_dir = tmp_path / "scripts", tmp_path / "out"
+    source_dir.mkdir()
+    records = _write_results(source_dir, 3)
+
+    manifest = app.write_archive_shards(str(source_dir), records, str(dest_dir), "sermons", max_files=2)
+    assert [shard["name"] for shard in manifest["shards"]] == ["sermons-part001.zip", "sermons-part002.zip"]
+    for shard in manifest["shards"]:
+        data = (dest_dir / shard["name"]).read_bytes()
+        assert shard["sha256"] == hashlib.sha256(data).hexdigest()
+        assert shard["bytes"] == len(data)
+
+    for video in manifest["videos"]:
+        with zipfile.ZipFile(dest_dir / video["shard"]) as archive:
+            body = archive.read(video["file"])
+        assert video["sha256"] == hashlib.sha256(body).hexdigest()
+        assert body == (source_dir / video["file"]).read_bytes()
+
+
+def test_single_shard_name_and_saved_manifest(tmp_path):
+    source_dir, dest_dir = tmp_path / "scripts", tmp_path / "out"
+    source_dir.mkdir()
+    records = _write_results(source_dir, 2)
+
+    manifest = app.write_archive_shards(str(source_dir), records, str(dest_dir), "sermons", compresslevel=0)
+    assert [shard["name"] for shard in manifest["shards"]] == ["sermons.zip"]
+
+    json_path, csv_path = app.save_manifest(manifest, str(dest_dir))
+    public = json.loads(pathlib.Path(json_path).read_text(encoding="utf-8"))
+    assert "path" not in public["shards"][0]
+    raw = pathlib.Path(csv_path).read_bytes().decode("utf-8")
+    assert raw.startswith("\ufeffvideo_id,")
+    rows = list(csv.DictReader(io.StringIO(raw.lstrip("\ufeff"))))
+    assert [row["sha256"] for row in rows] == [video["sha256"] for video in manifest["videos"]]
@@ -0,0 +1,74 @@
+"""
+ArtifactStore(끝난 작업 결과 보관소)의 보관 기간·용량 정리 테스트.
+
+실행: python -m pytest -q test_artifact_store.py
+"""
+
+import os
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """app의 time.time()을 테스트가 직접 돌리는 시계로 바꾼다 (같은 시각의 순서 모호함 방지)."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(app.time, "time", lambda: now[0])
+    return now
+
+
+def _put(store: app.ArtifactStore, tmp_path, job_id: str, size: int = 100) -> dict:
+    """size바이트짜리 샤드 하나를 가진 결과 디렉토리를 만들어 보관한다."""
+    source_dir = tmp_path / f"build-{job_id}"
+    source_dir.mkdir()
+    shard = source_dir / "sermons.zip"
+    shard.write_bytes(b"z" * size)
+    archive = {"name": "sermons", "shards": [{"name": "sermons.zip", "path": str(shard)}]}
+    return store.put(job_id, str(source_dir), archive, {"state": app.JOB_DONE})
+
+
+def test_put_moves_results_and_rewrites_paths(tmp_path):
+    store = app.ArtifactStore(str(tmp_path / "artifacts"))
+    archive = _put(store, tmp_path, "job-1")
+
+    assert archive["shards"][0]["path"] == str(tmp_path / "artifacts" / "job-1" / "sermons.zip")
+    assert os.path.exists(archive["shards"][0]["path"])
+    assert not os.path.exists(tmp_path / "build-job-1")
+    assert store.get("job-1") == {"archive": archive, "snapshot": {"state": app.JOB_DONE}}
+
+
+def test_expired_results_are_hidden_and_pruned(tmp_path, clock):
+    store = app.ArtifactStore(str(tmp_path / "artifacts"), ttl_hours=1)
+    _put(store, tmp_path, "job-old")
+    clock[0] += 2 * 3600
+
+    assert store.get("job-old") is None
+    store.prune()
+    assert not os.path.exists(tmp_path / "artifacts" / "job-old")
+
+
+def test_byte_cap_evicts_least_recently_used(tmp_path, clock):
+    store = app.ArtifactStore(str(tmp_path / "artifacts"), max_bytes=250)
+    for job_id in ("job-1", "job-2"):
+        _put(store, tmp_path, job_id)
+        clock[0] += 1
+    # job-1을 다시 받았으므로 가장 오래 안 쓴 결과는 job-2다
+    store.touch("job-1")
+    clock[0] += 1
+
+    _put(store, tmp_path, "job-3")
+    assert store.get("job-2") is None
+    assert not os.path.exists(tmp_path / "artifacts" / "job-2")
+    assert store.get("job-1") is not None
+    assert store.get("job-3") is not None
+
+
+def test_newest_result_is_kept_even_over_the_cap(tmp_path):
+    store = app.ArtifactStore(str(tmp_path / "artifacts"), max_bytes=50)
+    _put(store, tmp_path, "job-1")
+    _put(store, tmp_path, "job-big", size=500)
+
+    assert store.get("job-1") is None
+    assert store.get("job-big") is not None
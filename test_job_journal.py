@@ -0,0 +1,169 @@
+"""
+작업 저널(JobJournal)과 이어서 하기의 오프라인 테스트.
+
+네트워크 없이 받은 영상 ID만 기록하는 가짜 가져오기 계층으로, 중단된 작업을
+이어서 할 때 pending/failed-retryable 영상만 다시 요청하는지 확인한다.
+
+실행: python -m pytest -q test_job_journal.py
+"""
+
+import os
+import threading
+import time
+import zipfile
+
+import pytest
+
+import app
+
+OPTIONS = {
+    "concurrency": 2,
+    "requests_per_second": 100.0,
+    "refresh_cache": False,
+    "refresh_playlist": False,
+    "index_search": False,
+    "formats": [],
+    "sync_mode": False,
+    "compress_level": 6,
+    "cleaning_rules": app.CleaningRules(),
+}
+
+
+class RecordingFetcher:
+    """요청한 영상 ID를 기록하고 짧은 자막을 돌려주는 가짜 가져오기 계층."""
+
+    def __init__(self):
+        self.fetched: list[str] = []
+        self._lock = threading.Lock()
+
+    def fetch(self, video_id: str) -> dict:
+        with self._lock:
+            self.fetched.append(video_id)
+        return {"language": "ko", "snippets": [{"text": f"말씀 {video_id}", "start": 0.0, "duration": 1.0}]}
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """저장소·작업 디렉토리를 테스트마다 임시 디렉토리로 돌린다."""
+    monkeypatch.setattr(app, "APP_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(app, "JOBS_DIR", str(tmp_path / "jobs"))
+    return tmp_path
+
+
+def _entries(count: int) -> list[dict]:
+    return [
+        {"index": i, "id": f"v{i}", "title": f"설교 {i}", "upload_date": "20240101",
+         "url": f"https://www.youtube.com/watch?v=v{i}"}
+        for i in range(1, count + 1)
+    ]
+
+
+def _create(job_id: str, count: int = 5, listed: bool = True) -> app.JobJournal:
+    return app.JobJournal.create(
+        job_id,
+        sources=[{"label": "list-test", "url": "https://www.youtube.com/playlist?list=test"}],
+        entries=_entries(count),
+        options=OPTIONS,
+        listed=listed,
+    )
+
+
+def _interrupt(journal: app.JobJournal) -> None:
+    """v1 완료, v2 영구 실패, v3 429 실패, v4·v5 미처리인 채로 죽은 실행을 흉내 낸다."""
+    v1, v2, v3 = journal.entries[:3]
+    filename = app.build_filename(v1["index"], v1["upload_date"], v1["title"])
+    app.DirectorySink(journal.scripts_dir).write_text(filename, "이전 실행의 결과")
+    journal.record(v1, {"success": True, "outcome": app.OUTCOME_OK, "filename": filename})
+    journal.record(v2, {"success": False, "outcome": app.OUTCOME_NO_TRANSCRIPT, "error": "자막 없음"})
+    journal.record(v3, {"success": False, "outcome": app.OUTCOME_RATE_LIMITED, "error": "429"})
+
+
+def test_record_is_fsynced_and_replayed(data_dir, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(app.os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+    journal = _create("job-record")
+    _interrupt(journal)
+    assert len(synced) == 3
+
+    # 마지막 줄이 쓰다 만 채로 남아도 앞의 기록은 그대로 읽힌다
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 3, "status": "do')
+    reloaded = app.JobJournal.load("job-record")
+    assert reloaded.counts() == {
+        app.ENTRY_PENDING: 2,
+        app.ENTRY_DONE: 1,
+        app.ENTRY_FAILED_RETRYABLE: 1,
+        app.ENTRY_FAILED_PERMANENT: 1,
+    }
+    assert [entry["id"] for entry in reloaded.remaining_entries()] == ["v3", "v4", "v5"]
+    assert [(entry["id"], entry["filename"]) for entry in reloaded.completed()] == [
+        ("v1", "001 - 20240101 - 설교 1.txt"),
+    ]
+
+
+def test_list_jobs_shows_only_unfinished(data_dir):
+    _interrupt(_create("job-unfinished"))
+    finished = _create("job-finished", count=1)
+    finished.record(finished.entries[0], {"success": True, "outcome": app.OUTCOME_OK, "filename": "a.txt"})
+    _create("job-listing", count=0, listed=False)
+
+    jobs = {job["id"]: job for job in app.JobJournal.list_jobs()}
+    assert set(jobs) == {"job-unfinished", "job-listing"}
+    assert jobs["job-unfinished"]["counts"][app.ENTRY_PENDING] == 2
+    assert jobs["job-listing"]["listed"] is False
+
+
+def test_prune_removes_only_old_jobs(data_dir):
+    old, recent = _create("job-old"), _create("job-recent")
+    ten_days_ago = time.time() - 10 * 86400
+    os.utime(old.meta_path, (ten_days_ago, ten_days_ago))
+
+    app.JobJournal.prune(max_age_days=7)
+    assert not os.path.exists(old.job_dir)
+    assert os.path.exists(recent.job_dir)
+
+
+def test_iter_journal_entries_resumes_listing(data_dir, monkeypatch):
+    journal = _create("job-stream", count=2, listed=False)
+    journal.record(journal.entries[0], {"success": True, "outcome": app.OUTCOME_OK, "filename": "a.txt"})
+    monkeypatch.setattr(
+        app, "iter_playlist_entries", lambda url, endpoint=None, refresh=False: iter(_entries(5)),
+    )
+    manifest = app.SyncManifest("https://www.youtube.com/playlist?list=test")
+    manifest.mark_done({"id": "v4", "title": "설교 4"}, "004.txt")
+    found = {}
+
+    streamed = app.iter_journal_entries(journal, {"list-test": manifest}, on_found=found.__setitem__)
+    # 남은 v2 먼저, 이어서 저널에 없고 동기화되지 않은 영상만 (v1·v2는 이미 있고 v4는 동기화됨)
+    assert [entry["id"] for entry in streamed] == ["v2", "v3", "v5"]
+    assert found == {"list-test": 5}
+    assert app.JobJournal.load("job-stream").listed
+    assert [entry["id"] for entry in app.JobJournal.load("job-stream").entries] == ["v1", "v2", "v3", "v5"]
+
+
+def test_resume_fetches_only_pending_and_retryable(data_dir):
+    _interrupt(_create("job-resume"))
+    fetcher = RecordingFetcher()
+    manager = app.JobManager(fetcher=fetcher, artifacts=app.ArtifactStore(str(data_dir / "artifacts")))
+
+    job = manager.resume("job-resume")
+    deadline = time.time() + 30
+    while job.is_active and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert sorted(fetcher.fetched) == ["v3", "v4", "v5"]
+    assert job.snapshot()["state"] == app.JOB_DONE
+    assert app.JobJournal.load("job-resume").counts() == {
+        app.ENTRY_PENDING: 0,
+        app.ENTRY_DONE: 4,
+        app.ENTRY_FAILED_RETRYABLE: 0,
+        app.ENTRY_FAILED_PERMANENT: 1,
+    }
+    # 이전 실행에서 끝난 v1도 결과 ZIP에 들어간다
+    shard = manager.artifacts.get("job-resume")["archive"]["shards"][0]
+    with zipfile.ZipFile(shard["path"]) as archive:
+        assert sorted(name[:3] for name in archive.namelist()) == ["001", "003", "004", "005"]
@@ -0,0 +1,67 @@
+"""
+SearchIndex(bigram FTS5 색인)의 검색 동작 테스트.
+
+실행: python -m pytest -q test_search_index.py
+"""
+
+import sqlite3
+
+import app
+
+
+def _entry(video_id: str, title: str) -> dict:
+    return {"id": video_id, "title": title, "upload_date": "20240101", "url": None}
+
+
+def _found(index: app.SearchIndex, query: str) -> set[str]:
+    return {result["video_id"] for result in index.search(query)}
+
+
+def test_single_character_query_matches_word_end(tmp_path):
+    index = app.SearchIndex(str(tmp_path / "search.sqlite3"))
+    index.add(_entry("salt", "설교 1"), "소금과빛 되라")
+    index.add(_entry("light", "설교 2"), "빛이 있으라")
+
+    # '소금과빛'의 '빛'은 어떤 bigram의 첫 글자도 아니다
+    assert _found(index, "빛") == {"salt", "light"}
+    assert _found(index, "라") == {"salt", "light"}
+    assert _found(index, "금") == {"salt"}
+
+
+def test_multi_character_query_matches_inside_words(tmp_path):
+    index = app.SearchIndex(str(tmp_path / "search.sqlite3"))
+    index.add(_entry("faith", "믿음"), "믿음으로 구원을 받았으니")
+    index.add(_entry("love", "사랑"), "사랑은 오래 참고")
+
+    assert _found(index, "음으") == {"faith"}
+    assert _found(index, "믿음") == {"faith"}
+    assert _found(index, "믿음 구원") == {"faith"}
+    assert _found(index, "구원 사랑") == set()
+    assert _found(index, "사랑") == {"love"}
+
+
+def test_replacing_a_sermon_keeps_index_consistent(tmp_path):
+    index = app.SearchIndex(str(tmp_path / "search.sqlite3"))
+    index.add(_entry("v1", "설교"), "소금과빛")
+    index.add(_entry("v1", "설교"), "은혜와 진리")
+
+    assert _found(index, "빛") == set()
+    assert _found(index, "리") == {"v1"}
+    assert index.count() == 1
+
+
+def test_old_index_is_rebuilt_with_word_end_tokens(tmp_path):
+    path = str(tmp_path / "search.sqlite3")
+    index = app.SearchIndex(path)
+    index.add(_entry("salt", "설교"), "소금과빛 되라")
+    # 끝 글자 토큰이 없던 이전 색인을 흉내 낸다
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO sermon_grams (sermon_grams) VALUES ('delete-all')")
+        conn.execute(
+            "INSERT INTO sermon_grams (rowid, title, body) "
+            "SELECT rowid, '설교', '소금 금과 과빛 되라' FROM sermons"
+        )
+        conn.execute("PRAGMA user_version = 1")
+    assert _found(index, "빛") == set()
+
+    assert _found(app.SearchIndex(path), "빛") == {"salt"}
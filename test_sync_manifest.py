@@ -0,0 +1,54 @@
+"""
+SyncManifest(증분 동기화 매니페스트)의 delta 계산과 저장 테스트.
+
+실행: python -m pytest -q test_sync_manifest.py
+"""
+
+import json
+import os
+
+import app
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLsync"
+
+
+def _entries(*ids: str) -> list[dict]:
+    return [{"index": i, "id": video_id, "title": f"설교 {video_id}"} for i, video_id in enumerate(ids, 1)]
+
+
+def test_new_entries_skips_processed_and_keeps_order(tmp_path):
+    manifest = app.SyncManifest(PLAYLIST_URL, str(tmp_path / "sync.json"))
+    manifest.mark_done({"id": "b", "title": "설교 b"}, "002.txt")
+
+    delta = manifest.new_entries(_entries("a", "b", "c"))
+    assert [(entry["index"], entry["id"]) for entry in delta] == [(1, "a"), (3, "c")]
+
+
+def test_save_and_reload_round_trip(tmp_path):
+    path = str(tmp_path / "nested" / "sync.json")
+    manifest = app.SyncManifest(PLAYLIST_URL, path)
+    manifest.mark_done({"id": "a", "title": "설교 a"}, "001.txt")
+    manifest.save()
+
+    assert not os.path.exists(f"{path}.tmp")
+    reloaded = app.SyncManifest(PLAYLIST_URL, path)
+    assert reloaded.processed["a"]["filename"] == "001.txt"
+    # 다음 주에 두 편이 추가되면 그 두 편만 처리 대상이다
+    assert [entry["id"] for entry in reloaded.new_entries(_entries("a", "d", "e"))] == ["d", "e"]
+
+
+def test_unsaved_marks_are_not_persisted(tmp_path):
+    path = str(tmp_path / "sync.json")
+    app.SyncManifest(PLAYLIST_URL, path).mark_done({"id": "a", "title": "설교 a"}, "001.txt")
+
+    assert not os.path.exists(path)
+    assert app.SyncManifest(PLAYLIST_URL, path).processed == {}
+
+
+def test_default_path_is_keyed_by_playlist(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "APP_DATA_DIR", str(tmp_path))
+    manifest = app.SyncManifest(PLAYLIST_URL)
+    manifest.save()
+
+    expected = tmp_path / "sync" / f"{app.playlist_key(PLAYLIST_URL)}.json"
+    assert json.loads(expected.read_text(encoding="utf-8"))["url"] == PLAYLIST_URL
@@ -0,0 +1,150 @@
+"""
+겹침 제거·줄 병합·클리닝 엔진을 처음 구현(기준선)과 무작위 입력으로 비교하는 속성 테스트.
+
+왜: _find_overlap/remove_duplicate_lines/clean_text는 속도를 위해 여러 번
+다시 작성되었지만, 결과는 기준선과 바이트 단위로 같아야 한다 (이미 추출한
+결과물을 다시 클리닝해도 달라지지 않도록). 기준선 구현을 그대로 옮겨 두고
+한국어/영문이 섞인 무작위 입력에서 결과를 비교한다.
+
+실행: python -m pytest -q test_text_engine.py
+"""
+
+import random
+import re
+
+import app
+
+SEED = 20240101
+
+# 겹침이 자주 생기도록 글자 종류를 적게 잡는다
+ALPHABET = "가나다은혜 ab."
+WORDS = ["하나님의", "말씀", "은혜", "혜택", "사랑", "믿음으로", "구원", "the", "Lord", "is", "good", "아멘"]
+
+
+# ━━ 기준선 구현 (처음 버전 그대로) ━━
+
+def reference_find_overlap(prev: str, curr: str) -> int:
+    max_overlap = min(len(prev), len(curr))
+    best = 0
+
+    for i in range(1, max_overlap + 1):
+        if prev[-i:] == curr[:i]:
+            best = i
+
+    return best
+
+
+def reference_remove_duplicate_lines(lines: list[str]) -> str:
+    if not lines:
+        return ""
+
+    result = lines[0]
+    prev_line = lines[0]
+
+    for curr_line in lines[1:]:
+        if curr_line == prev_line:
+            continue
+
+        overlap_len = reference_find_overlap(prev_line, curr_line)
+
+        if overlap_len > 0:
+            new_part = curr_line[overlap_len:]
+            if new_part.strip():
+                result += new_part
+        else:
+            result += " " + curr_line
+
+        prev_line = curr_line
+
+    return result
+
+
+def reference_clean_text(raw: str) -> str:
+    text = re.sub(r"<[^>]+>", "", raw)
+    text = re.sub(r"\d{2}:\d{2}:\d{2}\.\d{3}", "", text)
+    text = re.sub(r"\[[\w\s]+\]", "", text)
+    text = re.sub(r"&\w+;", " ", text)
+    text = re.sub(r"-->", "", text)
+    text = re.sub(r"[^\w\s가-힣a-zA-Z0-9.,!?·\-~()\"'。，！？]", "", text)
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\n{2,}", "\n", text)
+    cleaned_lines = [line.strip() for line in text.split("\n") if line.strip()]
+    return "\n".join(cleaned_lines)
+
+
+# ━━ 무작위 입력 ━━
+
+def _random_text(rng: random.Random, max_len: int = 12) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_len)))
+
+
+def _random_lines(rng: random.Random) -> list[str]:
+    """자막처럼 앞 줄의 끝을 이어받거나, 바로 앞/두 줄 앞을 반복하는 줄 목록."""
+    lines: list[str] = []
+    for _ in range(rng.randint(0, 12)):
+        roll = rng.random()
+        if lines and roll < 0.3:
+            prev = lines[-1]
+            cut = rng.randint(0, len(prev))
+            lines.append(prev[cut:] + " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 3))))
+        elif lines and roll < 0.45:
+            lines.append(lines[-1])
+        elif len(lines) >= 2 and roll < 0.6:
+            lines.append(lines[-2])
+        elif roll < 0.8:
+            lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))))
+        else:
+            lines.append(_random_text(rng))
+    return lines
+
+
+def _random_raw(rng: random.Random) -> str:
+    pieces = WORDS + [
+        "<c>", "</c>", "<font color=\"#fff\">", "[음악]", "[Music]", "&amp;", "&nbsp;",
+        "00:00:01.234 --> 00:00:03.000", "-->", "!", "?", "@", "#", "…", "♪", "(웃음)",
+        "\n", "\n\n", "  ", "\t",
+    ]
+    return " ".join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+
+
+# ━━ 테스트 ━━
+
+def test_find_overlap_matches_reference():
+    rng = random.Random(SEED)
+    for _ in range(20000):
+        prev, curr = _random_text(rng), _random_text(rng)
+        expected = reference_find_overlap(prev, curr)
+        assert app._find_overlap(prev, curr) == expected, (prev, curr)
+        assert app._find_overlap_kmp(prev, curr) == expected, (prev, curr)
+
+
+def test_find_overlap_repetitive_input_uses_linear_path():
+    # 같은 글자가 반복되면 빠른 경로의 후보가 많아져 KMP로 넘어간다
+    for n in (1, 50, 5000):
+        prev = "아" * n
+        curr = "아" * (n // 2) + "멘"
+        assert app._find_overlap(prev, curr) == reference_find_overlap(prev, curr)
+
+
+def test_word_boundary_paths_agree():
+    rng = random.Random(SEED + 1)
+    for _ in range(5000):
+        prev = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 4)))
+        curr = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 4)))
+        assert app._find_overlap(prev, curr, True) == app._find_overlap_kmp(prev, curr, True)
+
+
+def test_remove_duplicate_lines_matches_reference():
+    rng = random.Random(SEED + 2)
+    for _ in range(20000):
+        lines = _random_lines(rng)
+        expected = reference_remove_duplicate_lines(lines)
+        assert app.remove_duplicate_lines(lines) == expected, lines
+        assert app.remove_duplicate_lines(iter(lines)) == expected, lines
+
+
+def test_clean_text_matches_reference():
+    rng = random.Random(SEED + 3)
+    for _ in range(5000):
+        raw = _random_raw(rng)
+        assert app.clean_text(raw) == reference_clean_text(raw), raw
@@ -0,0 +1,73 @@
+"""
+TranscriptCache(자막 SQLite 캐시)의 기간·용량 정리 테스트.
+
+실행: python -m pytest -q test_transcript_cache.py
+"""
+
+import json
+
+import pytest
+
+import app
+
+
+def _transcript(text: str) -> dict:
+    return {"language": "ko", "snippets": [{"text": text, "start": 0.0, "duration": 1.0}]}
+
+
+def _size(transcript: dict) -> int:
+    return len(json.dumps(transcript["snippets"], ensure_ascii=False).encode("utf-8"))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """app의 time.time()을 테스트가 직접 돌리는 시계로 바꾼다 (같은 시각의 순서 모호함 방지)."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(app.time, "time", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_transcript(tmp_path):
+    cache = app.TranscriptCache(str(tmp_path / "transcripts.sqlite3"))
+    cache.put("v1", _transcript("말씀"))
+
+    assert cache.get("v1") == _transcript("말씀")
+    assert cache.get("v2") is None
+
+
+def test_expired_entries_are_missed_and_evicted(tmp_path, clock):
+    cache = app.TranscriptCache(str(tmp_path / "transcripts.sqlite3"), max_age_days=7)
+    cache.put("old", _transcript("지난 설교"))
+    clock[0] += 8 * 86400
+
+    assert cache.get("old") is None
+    cache.put("new", _transcript("이번 설교"))
+    with cache._connect() as conn:
+        assert [row[0] for row in conn.execute("SELECT video_id FROM transcripts")] == ["new"]
+
+
+def test_byte_cap_evicts_least_recently_used(tmp_path, clock):
+    entry_bytes = _size(_transcript("설교 1"))
+    cache = app.TranscriptCache(str(tmp_path / "transcripts.sqlite3"), max_bytes=2 * entry_bytes)
+    for number in (1, 2):
+        cache.put(f"v{number}", _transcript(f"설교 {number}"))
+        clock[0] += 1
+    # v1을 다시 읽었으므로 가장 오래 안 쓴 항목은 v2다
+    assert cache.get("v1") is not None
+    clock[0] += 1
+
+    cache.put("v3", _transcript("설교 3"))
+    assert cache.get("v2") is None
+    assert cache.get("v1") is not None
+    assert cache.get("v3") is not None
+
+
+def test_invalidate_one_or_all(tmp_path):
+    cache = app.TranscriptCache(str(tmp_path / "transcripts.sqlite3"))
+    cache.put("v1", _transcript("가"))
+    cache.put("v2", _transcript("나"))
+
+    cache.invalidate("v1")
+    assert cache.get("v1") is None and cache.get("v2") is not None
+    cache.invalidate()
+    assert cache.get("v2") is None